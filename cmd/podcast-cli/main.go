@@ -1,16 +1,29 @@
 package main
 
 import (
+	"context"
 	"fmt"
 	"os"
+	"os/signal"
+	"syscall"
 
 	"github.com/automate-podcast/internal/cli"
 )
 
 func main() {
+	// Ctrl-C / SIGTERM でコマンドのコンテキストをキャンセルする
+	// 2回目のシグナルは通常どおりプロセスを終了させる
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	go func() {
+		<-ctx.Done()
+		stop()
+	}()
+
 	// ルートコマンドの作成と実行
 	rootCmd := cli.NewRootCmd()
-	if err := rootCmd.Execute(); err != nil {
+	err := rootCmd.ExecuteContext(ctx)
+	stop()
+	if err != nil {
 		fmt.Println(err)
 		os.Exit(1)
 	}
@@ -1,10 +1,12 @@
 package cli
 
 import (
+	"context"
 	"fmt"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 
 	"github.com/automate-podcast/config"
 	"github.com/automate-podcast/internal/model"
@@ -81,7 +83,7 @@ func Step1Cmd() *cobra.Command {
 			}
 
 			// Generate content
-			candidates, err := contentProcessor.GenerateCandidates(transcript, genShownotes)
+			candidates, err := contentProcessor.GenerateCandidates(cmd.Context(), transcript, genShownotes)
 			if err != nil {
 				return fmt.Errorf("content generation failed: %w", err)
 			}
@@ -98,17 +100,18 @@ func Step1Cmd() *cobra.Command {
 			// Save all candidates to file if output directory is specified
 			if outputDir != "" {
 				allCandidatesPath := filepath.Join(outputDir, "all_candidates.txt")
-				content := "=== Title Candidates ===\n"
+				var content strings.Builder
+				content.WriteString("=== Title Candidates ===\n")
 				for i, title := range candidates.Titles {
-					content += fmt.Sprintf("%d: %s\n", i+1, title)
+					fmt.Fprintf(&content, "%d: %s\n", i+1, title)
 				}
 
-				content += "\n=== Show Note Candidates ===\n"
+				content.WriteString("\n=== Show Note Candidates ===\n")
 				for i, note := range candidates.ShowNotes {
-					content += fmt.Sprintf("%d:\n%s\n\n", i+1, note)
+					fmt.Fprintf(&content, "%d:\n%s\n\n", i+1, note)
 				}
 
-				if err := os.WriteFile(allCandidatesPath, []byte(content), 0644); err != nil {
+				if err := os.WriteFile(allCandidatesPath, []byte(content.String()), 0644); err != nil {
 					logger.Warnf("Failed to save all candidates to file: %v", err)
 				} else {
 					logger.Infof("All candidates saved to %s", allCandidatesPath)
@@ -268,8 +271,7 @@ func Step3Cmd() *cobra.Command {
 			vercelService := services.NewVercelServiceFromEnv(logger)
 
 			// Check if Vercel deploy hook is configured
-			deployHookURL := os.Getenv("VERCEL_DEPLOY_HOOK")
-			if deployHookURL == "" {
+			if !vercelService.IsConfigured() {
 				return fmt.Errorf("Vercel deploy hook URL is not configured. Please set the VERCEL_DEPLOY_HOOK environment variable")
 			}
 
@@ -367,29 +369,56 @@ func Step4Cmd() *cobra.Command {
 			// Initialize SNS service
 			snsService := services.NewSNSService(logger)
 
-			// Fetch latest episode title from RSS feed
-			logger.Info("Fetching latest episode title from RSS feed...")
-			title, err := snsService.GetLatestEpisodeTitle(cmd.Context(), rssURL)
-			if err != nil {
-				return fmt.Errorf("failed to fetch latest episode title: %w", err)
+			// The RSS feed and the two platform pages are independent, so
+			// fetch them concurrently and wait for all three; a failed title
+			// fetch is fatal, so it cancels the other two
+			fetchCtx, cancelFetch := context.WithCancel(cmd.Context())
+			defer cancelFetch()
+			var (
+				wg         sync.WaitGroup
+				title      string
+				spotifyURL string
+				appleURL   string
+				titleErr   error
+				spotifyErr error
+				appleErr   error
+			)
+			logger.Info("Fetching latest episode title, Spotify URL and Apple Podcast URL...")
+			wg.Add(3)
+			go func() {
+				defer wg.Done()
+				title, titleErr = snsService.GetLatestEpisodeTitle(fetchCtx, rssURL)
+				if titleErr != nil {
+					cancelFetch()
+				}
+			}()
+			go func() {
+				defer wg.Done()
+				spotifyURL, spotifyErr = snsService.GetLatestSpotifyURL(fetchCtx, spotifyShowURL)
+			}()
+			go func() {
+				defer wg.Done()
+				appleURL, appleErr = snsService.GetLatestApplePodcastURL(fetchCtx, applePodcastShowURL)
+			}()
+			wg.Wait()
+
+			// Latest episode title from RSS feed
+			if titleErr != nil {
+				return fmt.Errorf("failed to fetch latest episode title: %w", titleErr)
 			}
 			logger.Infof("Latest episode title: %s", title)
 
-			// Fetch latest Spotify episode URL
-			logger.Info("Fetching latest Spotify episode URL...")
-			spotifyURL, err := snsService.GetLatestSpotifyURL(cmd.Context(), spotifyShowURL)
-			if err != nil {
-				logger.Warnf("Failed to fetch latest Spotify episode URL: %v", err)
+			// Latest Spotify episode URL
+			if spotifyErr != nil {
+				logger.Warnf("Failed to fetch latest Spotify episode URL: %v", spotifyErr)
 				logger.Warn("Using Spotify show URL as fallback")
 				spotifyURL = spotifyShowURL
 			}
 			logger.Infof("Spotify URL: %s", spotifyURL)
 
-			// Fetch latest Apple Podcast episode URL
-			logger.Info("Fetching latest Apple Podcast episode URL...")
-			appleURL, err := snsService.GetLatestApplePodcastURL(cmd.Context(), applePodcastShowURL)
-			if err != nil {
-				logger.Warnf("Failed to fetch latest Apple Podcast episode URL: %v", err)
+			// Latest Apple Podcast episode URL
+			if appleErr != nil {
+				logger.Warnf("Failed to fetch latest Apple Podcast episode URL: %v", appleErr)
 				logger.Warn("Using Apple Podcast show URL as fallback")
 				appleURL = applePodcastShowURL
 			}
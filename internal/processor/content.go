@@ -24,8 +24,7 @@ func NewContentProcessor(aiService *services.AIService, logger *logrus.Logger) *
 }
 
 // GenerateCandidates generates content candidates from a transcript
-func (p *ContentProcessor) GenerateCandidates(transcript string, generateShowNotes bool) (*model.ContentCandidates, error) {
-	ctx := context.Background()
+func (p *ContentProcessor) GenerateCandidates(ctx context.Context, transcript string, generateShowNotes bool) (*model.ContentCandidates, error) {
 	result := &model.ContentCandidates{}
 
 	p.logger.Info("Starting content generation process...")
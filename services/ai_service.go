@@ -2,13 +2,32 @@ package services
 
 import (
 	"context"
+	"errors"
 	"fmt"
+	"net/http"
 	"strings"
+	"time"
 
 	"github.com/sashabaranov/go-openai"
 	"github.com/sirupsen/logrus"
 )
 
+// contentSystemPrompt is the system message for GenerateAllContent
+const contentSystemPrompt = "You are GenerativeAI acting as a podcast copy‑writer for a Japanese podcast about parenting and technology. Follow the formatting instructions EXACTLY."
+
+// contentPromptPrefix and contentPromptSuffix wrap the transcript in the user
+// message; plain concatenation avoids re-parsing a format string per call
+const (
+	contentPromptPrefix = "You are GenerativeAI acting as a podcast copy‑writer for a Japanese podcast about parenting and technology.\n\nPlease generate the following content for this podcast episode:\n\n1. TITLE: Follow this pattern exactly:\n   NN. ＜Japanese topic 1＞ / ＜Japanese topic 2＞ [/ ＜Japanese topic 3＞]\n   * NN = episode number (integer)\n   * Provide 2 or 3 topics\n   * Topics should be mainly in Japanese, but keep any necessary English words as‑is (AI, GPT, etc.)\n\n2. SHOW NOTE: Create exactly this format:\n   * Opening summary: 2-3 lines in friendly Japanese with relevant emojis. Each sentence MUST end with an exclamation mark (!)\n   * Bullet points: 8-12 points, each formatted as: [emoji] [Bold headline in Japanese]: [Short description, maximum 1 line]\n   * CTA block: Wrapped in dotted lines (\"………\"), asking for feedback via hashtag #momitfm\n   * Credits section: Must be titled exactly \"✨🎧 Credits\" and list hosts (@_yukamiya & @m2vela) and intro creator (@kirillovlov2983)\n\nHere is the transcript of the podcast:\n"
+	contentPromptSuffix = "\n\nFormat your response with clear section headers [TITLE] and [SHOW NOTE] to separate the content."
+)
+
+// Retry settings for rate-limited or temporarily unavailable OpenAI requests
+const (
+	maxCompletionRetries = 3
+	initialRetryBackoff  = 2 * time.Second
+)
+
 // AIService is a service responsible for AI-related processing
 type AIService struct {
 	openAIAPIKey string
@@ -36,10 +55,7 @@ func (s *AIService) GenerateAllContent(ctx context.Context, transcript string) (
 	fullTranscript := transcript
 
 	// Create a combined prompt that requests both title and show note
-	prompt := fmt.Sprintf(
-		"You are GenerativeAI acting as a podcast copy‑writer for a Japanese podcast about parenting and technology.\n\nPlease generate the following content for this podcast episode:\n\n1. TITLE: Follow this pattern exactly:\n   NN. ＜Japanese topic 1＞ / ＜Japanese topic 2＞ [/ ＜Japanese topic 3＞]\n   * NN = episode number (integer)\n   * Provide 2 or 3 topics\n   * Topics should be mainly in Japanese, but keep any necessary English words as‑is (AI, GPT, etc.)\n\n2. SHOW NOTE: Create exactly this format:\n   * Opening summary: 2-3 lines in friendly Japanese with relevant emojis. Each sentence MUST end with an exclamation mark (!)\n   * Bullet points: 8-12 points, each formatted as: [emoji] [Bold headline in Japanese]: [Short description, maximum 1 line]\n   * CTA block: Wrapped in dotted lines (\"………\"), asking for feedback via hashtag #momitfm\n   * Credits section: Must be titled exactly \"✨🎧 Credits\" and list hosts (@_yukamiya & @m2vela) and intro creator (@kirillovlov2983)\n\nHere is the transcript of the podcast:\n%s\n\nFormat your response with clear section headers [TITLE] and [SHOW NOTE] to separate the content.",
-		fullTranscript,
-	)
+	prompt := contentPromptPrefix + fullTranscript + contentPromptSuffix
 
 	// Create the OpenAI API request
 	req := openai.ChatCompletionRequest{
@@ -47,7 +63,7 @@ func (s *AIService) GenerateAllContent(ctx context.Context, transcript string) (
 		Messages: []openai.ChatCompletionMessage{
 			{
 				Role:    openai.ChatMessageRoleSystem,
-				Content: "You are GenerativeAI acting as a podcast copy‑writer for a Japanese podcast about parenting and technology. Follow the formatting instructions EXACTLY.",
+				Content: contentSystemPrompt,
 			},
 			{
 				Role:    openai.ChatMessageRoleUser,
@@ -59,7 +75,7 @@ func (s *AIService) GenerateAllContent(ctx context.Context, transcript string) (
 	}
 
 	// Make the API call
-	resp, err := s.client.CreateChatCompletion(ctx, req)
+	resp, err := s.createChatCompletion(ctx, req)
 	if err != nil {
 		s.logger.Errorf("OpenAI API error: %v", err)
 		return nil, nil, fmt.Errorf("failed to generate content: %w", err)
@@ -103,6 +119,49 @@ func (s *AIService) GenerateAllContent(ctx context.Context, transcript string) (
 	return titles, showNotes, nil
 }
 
+// createChatCompletion calls the chat completion API, backing off and retrying
+// when OpenAI responds with a rate limit or server error
+func (s *AIService) createChatCompletion(ctx context.Context, req openai.ChatCompletionRequest) (openai.ChatCompletionResponse, error) {
+	backoff := initialRetryBackoff
+	for attempt := 0; ; attempt++ {
+		resp, err := s.client.CreateChatCompletion(ctx, req)
+		if err == nil || attempt >= maxCompletionRetries || !isRetryableOpenAIError(err) {
+			return resp, err
+		}
+
+		s.logger.Warnf("OpenAI request failed (%v), retrying in %s", err, backoff)
+		select {
+		case <-ctx.Done():
+			return resp, ctx.Err()
+		case <-time.After(backoff):
+		}
+		backoff *= 2
+	}
+}
+
+// insufficientQuotaError is the OpenAI error type and code for an exhausted
+// quota, which is also reported as a 429 but does not clear with time
+const insufficientQuotaError = "insufficient_quota"
+
+// isRetryableOpenAIError reports whether err is a transient 429 or 5xx API response
+func isRetryableOpenAIError(err error) bool {
+	var status int
+	var apiErr *openai.APIError
+	var reqErr *openai.RequestError
+	switch {
+	case errors.As(err, &apiErr):
+		if apiErr.Type == insufficientQuotaError || apiErr.Code == insufficientQuotaError {
+			return false
+		}
+		status = apiErr.HTTPStatusCode
+	case errors.As(err, &reqErr):
+		status = reqErr.HTTPStatusCode
+	default:
+		return false
+	}
+	return status == http.StatusTooManyRequests || status >= http.StatusInternalServerError
+}
+
 // GenerateTitles generates title candidates from a transcript
 // This is kept for backward compatibility, but now uses GenerateAllContent internally
 func (s *AIService) GenerateTitles(ctx context.Context, transcript string) ([]string, error) {
@@ -16,9 +16,17 @@ import (
 type Art19Service struct {
 	username string
 	password string
+	client   *http.Client
 	logger   *logrus.Logger
 }
 
+// playwrightScriptRequest is the request body for the Playwright MCP server's
+// /run-script endpoint
+type playwrightScriptRequest struct {
+	Script string            `json:"script"`
+	Env    map[string]string `json:"env"`
+}
+
 // UploadDraftTitle uploads only the title to Art19 as a draft (placeholder implementation)
 func (s *Art19Service) UploadDraftTitle(ctx context.Context, title string) error {
 	s.logger.Infof("Uploading draft title to Art19: %s", title)
@@ -30,13 +38,13 @@ func (s *Art19Service) UploadDraftTitle(ctx context.Context, title string) error
 	}
 
 	// Playwright MCPサーバーにPOST
-	payload := map[string]interface{}{
-		"script": "scripts/art19_upload_title.js",
-		"env": map[string]string{
-			"ART19_USERNAME": s.username,
-			"ART19_PASSWORD": s.password,
+	payload := playwrightScriptRequest{
+		Script: "scripts/art19_upload_title.js",
+		Env: map[string]string{
+			"ART19_USERNAME":        s.username,
+			"ART19_PASSWORD":        s.password,
 			"ART19_EPISODE_NEW_URL": art19EpisodeNewURL,
-			"EPISODE_TITLE":  title,
+			"EPISODE_TITLE":         title,
 		},
 	}
 	data, err := json.Marshal(payload)
@@ -44,7 +52,13 @@ func (s *Art19Service) UploadDraftTitle(ctx context.Context, title string) error
 		return fmt.Errorf("failed to marshal Playwright payload: %w", err)
 	}
 
-	resp, err := http.Post("http://localhost:3001/run-script", "application/json", bytes.NewBuffer(data)) // 例: MCPサーバーは3001番
+	req, err := http.NewRequestWithContext(ctx, "POST", "http://localhost:3001/run-script", bytes.NewBuffer(data)) // 例: MCPサーバーは3001番
+	if err != nil {
+		return fmt.Errorf("failed to create Playwright MCP request: %w", err)
+	}
+	req.Header.Set("Content-Type", "application/json")
+
+	resp, err := s.client.Do(req)
 	if err != nil {
 		return fmt.Errorf("failed to call Playwright MCP server: %w", err)
 	}
@@ -64,7 +78,11 @@ func NewArt19Service(username, password string, logger *logrus.Logger) *Art19Ser
 	return &Art19Service{
 		username: username,
 		password: password,
-		logger:   logger,
+		// No client timeout: the MCP server replies only after the browser
+		// automation finishes; the request ends early only if ctx is
+		// cancelled, e.g. by Ctrl-C
+		client: http.DefaultClient,
+		logger: logger,
 	}
 }
 
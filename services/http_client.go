@@ -0,0 +1,13 @@
+package services
+
+import (
+	"net/http"
+	"time"
+)
+
+// sharedHTTPClient is used by services that make short API and page requests
+// so they share one keep-alive connection pool and a common timeout instead of
+// each service configuring its own client.
+var sharedHTTPClient = &http.Client{
+	Timeout: 30 * time.Second,
+}
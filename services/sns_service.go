@@ -8,7 +8,6 @@ import (
 	"net/http"
 	"regexp"
 	"strings"
-	"time"
 
 	"github.com/sirupsen/logrus"
 )
@@ -29,6 +28,12 @@ type RSSFeed struct {
 	} `xml:"channel"`
 }
 
+// Episode link patterns, compiled once and matched against the raw page bytes
+var (
+	spotifyEpisodeURLPattern = regexp.MustCompile(`https://open\.spotify\.com/episode/[a-zA-Z0-9]+`)
+	appleEpisodeURLPattern   = regexp.MustCompile(`https://podcasts\.apple\.com/us/podcast/[^"]+/id1589345170\?i=[0-9]+`)
+)
+
 // SNSService handles generating text for social media posts
 type SNSService struct {
 	client *http.Client
@@ -38,9 +43,7 @@ type SNSService struct {
 // NewSNSService creates a new SNSService instance
 func NewSNSService(logger *logrus.Logger) *SNSService {
 	return &SNSService{
-		client: &http.Client{
-			Timeout: 30 * time.Second,
-		},
+		client: sharedHTTPClient,
 		logger: logger,
 	}
 }
@@ -49,7 +52,7 @@ func NewSNSService(logger *logrus.Logger) *SNSService {
 func (s *SNSService) GetLatestEpisodeTitle(ctx context.Context, rssURL string) (string, error) {
 	s.logger.Debugf("Fetching latest episode title from RSS feed: %s", rssURL)
 	
-	feed, err := s.fetchRSSFeed(rssURL)
+	feed, err := s.fetchRSSFeed(ctx, rssURL)
 	if err != nil {
 		return "", err
 	}
@@ -87,16 +90,15 @@ func (s *SNSService) GetLatestSpotifyURL(ctx context.Context, showURL string) (s
 	
 	// Find the latest episode URL using regex
 	// This is a simplified approach and might need adjustment based on actual HTML structure
-	re := regexp.MustCompile(`https://open\.spotify\.com/episode/[a-zA-Z0-9]+`)
-	matches := re.FindStringSubmatch(string(body))
+	match := spotifyEpisodeURLPattern.Find(body)
 	
-	if len(matches) == 0 {
+	if match == nil {
 		// If we can't find the episode link, return the show URL as fallback
 		s.logger.Warn("Could not find latest episode URL from Spotify, using show URL as fallback")
 		return showURL, nil
 	}
 	
-	episodeURL := matches[0]
+	episodeURL := string(match)
 	s.logger.Debugf("Latest Spotify episode URL: %s", episodeURL)
 	
 	return episodeURL, nil
@@ -125,16 +127,15 @@ func (s *SNSService) GetLatestApplePodcastURL(ctx context.Context, showURL strin
 	
 	// Find the latest episode URL using regex
 	// This is a simplified approach and might need adjustment based on actual HTML structure
-	re := regexp.MustCompile(`https://podcasts\.apple\.com/us/podcast/[^"]+/id1589345170\?i=[0-9]+`)
-	matches := re.FindStringSubmatch(string(body))
+	match := appleEpisodeURLPattern.Find(body)
 	
-	if len(matches) == 0 {
+	if match == nil {
 		// If we can't find the episode link, return the show URL as fallback
 		s.logger.Warn("Could not find latest episode URL from Apple Podcasts, using show URL as fallback")
 		return showURL, nil
 	}
 	
-	episodeURL := matches[0]
+	episodeURL := string(match)
 	s.logger.Debugf("Latest Apple Podcasts episode URL: %s", episodeURL)
 	
 	return episodeURL, nil
@@ -168,8 +169,13 @@ func (s *SNSService) CreateSNSPostText(title, spotifyURL, applePodcastURL string
 }
 
 // fetchRSSFeed fetches and parses an RSS feed from the given URL
-func (s *SNSService) fetchRSSFeed(url string) (*RSSFeed, error) {
-	resp, err := s.client.Get(url)
+func (s *SNSService) fetchRSSFeed(ctx context.Context, url string) (*RSSFeed, error) {
+	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create request for RSS feed: %w", err)
+	}
+
+	resp, err := s.client.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("failed to fetch RSS feed: %w", err)
 	}
@@ -179,13 +185,10 @@ func (s *SNSService) fetchRSSFeed(url string) (*RSSFeed, error) {
 		return nil, fmt.Errorf("failed to fetch RSS feed, status code: %d", resp.StatusCode)
 	}
 	
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read RSS feed: %w", err)
-	}
-	
+	// Decode straight from the response body instead of buffering the whole
+	// feed first; podcast feeds carry every episode and can be several MB
 	var feed RSSFeed
-	if err := xml.Unmarshal(body, &feed); err != nil {
+	if err := xml.NewDecoder(resp.Body).Decode(&feed); err != nil {
 		return nil, fmt.Errorf("failed to parse RSS feed: %w", err)
 	}
 	
@@ -6,15 +6,21 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"mime/multipart"
 	"net/http"
 	"os"
+	"path/filepath"
 
 	"github.com/sirupsen/logrus"
 )
 
+// maxTranscriptionFileSize is the largest upload the transcription API accepts
+const maxTranscriptionFileSize = 25 << 20
+
 // TranscriptionService handles audio transcription using OpenAI's Whisper API
 type TranscriptionService struct {
 	apiKey string
+	client *http.Client
 	logger *logrus.Logger
 }
 
@@ -22,6 +28,9 @@ type TranscriptionService struct {
 func NewTranscriptionService(apiKey string, logger *logrus.Logger) *TranscriptionService {
 	return &TranscriptionService{
 		apiKey: apiKey,
+		// No client timeout: uploading and transcribing a full episode can
+		// take minutes; the request ends early only if ctx is cancelled
+		client: http.DefaultClient,
 		logger: logger,
 	}
 }
@@ -37,10 +46,23 @@ func (s *TranscriptionService) Transcribe(ctx context.Context, audioPath string)
 	}
 	defer file.Close()
 
-	// Create a buffer to store the file
+	// Reject files the API would refuse before uploading them
+	info, err := file.Stat()
+	if err != nil {
+		return "", fmt.Errorf("failed to stat audio file: %w", err)
+	}
+	if info.Size() > maxTranscriptionFileSize {
+		return "", fmt.Errorf("audio file is %d bytes, exceeding the %d-byte transcription API limit; compress or split it first",
+			info.Size(), maxTranscriptionFileSize)
+	}
+
+	// Build the multipart form in memory; the size check above bounds it, and
+	// a buffered body lets the request carry a Content-Length
 	var buf bytes.Buffer
-	if _, err := io.Copy(&buf, file); err != nil {
-		return "", fmt.Errorf("failed to read audio file: %w", err)
+	buf.Grow(int(info.Size()) + 1024)
+	form := multipart.NewWriter(&buf)
+	if err := writeTranscriptionForm(form, file); err != nil {
+		return "", fmt.Errorf("failed to build request body: %w", err)
 	}
 
 	// Create the request
@@ -56,11 +78,10 @@ func (s *TranscriptionService) Transcribe(ctx context.Context, audioPath string)
 
 	// Set headers
 	req.Header.Set("Authorization", "Bearer "+s.apiKey)
-	req.Header.Set("Content-Type", "multipart/form-data")
+	req.Header.Set("Content-Type", form.FormDataContentType())
 
 	// Send the request
-	client := &http.Client{}
-	resp, err := client.Do(req)
+	resp, err := s.client.Do(req)
 	if err != nil {
 		return "", fmt.Errorf("failed to send request: %w", err)
 	}
@@ -72,6 +93,10 @@ func (s *TranscriptionService) Transcribe(ctx context.Context, audioPath string)
 		return "", fmt.Errorf("failed to read response: %w", err)
 	}
 
+	if resp.StatusCode != http.StatusOK {
+		return "", fmt.Errorf("transcription API error (status %d): %s", resp.StatusCode, string(body))
+	}
+
 	// Parse the response
 	var result struct {
 		Text string `json:"text"`
@@ -83,3 +108,21 @@ func (s *TranscriptionService) Transcribe(ctx context.Context, audioPath string)
 	s.logger.Infof("Transcription completed successfully")
 	return result.Text, nil
 }
+
+// writeTranscriptionForm writes the Whisper request fields and the audio file
+// part to form, then closes it
+func writeTranscriptionForm(form *multipart.Writer, file *os.File) error {
+	if err := form.WriteField("model", "whisper-1"); err != nil {
+		return err
+	}
+
+	part, err := form.CreateFormFile("file", filepath.Base(file.Name()))
+	if err != nil {
+		return err
+	}
+	if _, err := io.Copy(part, file); err != nil {
+		return fmt.Errorf("failed to read audio file: %w", err)
+	}
+
+	return form.Close()
+}
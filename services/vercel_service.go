@@ -6,7 +6,6 @@ import (
 	"io"
 	"net/http"
 	"os"
-	"time"
 
 	"github.com/sirupsen/logrus"
 )
@@ -20,14 +19,9 @@ type VercelService struct {
 
 // NewVercelService creates a new VercelService instance
 func NewVercelService(deployHookURL string, logger *logrus.Logger) *VercelService {
-	// Initialize HTTP client with timeout
-	client := &http.Client{
-		Timeout: time.Second * 30,
-	}
-
 	return &VercelService{
 		deployHookURL: deployHookURL,
-		client:        client,
+		client:        sharedHTTPClient,
 		logger:        logger,
 	}
 }
@@ -35,18 +29,12 @@ func NewVercelService(deployHookURL string, logger *logrus.Logger) *VercelServic
 // NewVercelServiceFromEnv creates a new VercelService instance using environment variables
 func NewVercelServiceFromEnv(logger *logrus.Logger) *VercelService {
 	// Get deploy hook URL from environment variable
-	deployHookURL := os.Getenv("VERCEL_DEPLOY_HOOK")
-
-	// Initialize HTTP client with timeout
-	client := &http.Client{
-		Timeout: time.Second * 30,
-	}
+	return NewVercelService(os.Getenv("VERCEL_DEPLOY_HOOK"), logger)
+}
 
-	return &VercelService{
-		deployHookURL: deployHookURL,
-		client:        client,
-		logger:        logger,
-	}
+// IsConfigured reports whether a deploy hook URL is set
+func (s *VercelService) IsConfigured() bool {
+	return s.deployHookURL != ""
 }
 
 // TriggerRedeploy triggers a redeployment of the website on Vercel
@@ -79,9 +67,12 @@ func (s *VercelService) TriggerRedeploy(ctx context.Context) error {
 
 	// Check the response status
 	if resp.StatusCode < 200 || resp.StatusCode >= 300 {
-		// Read the response body for error details
-		body, _ := io.ReadAll(resp.Body)
-		s.logger.Debugf("Response body: %s", string(body))
+		// Read the response body for error details; it is only logged at
+		// debug level, so skip reading it otherwise
+		if s.logger.IsLevelEnabled(logrus.DebugLevel) {
+			body, _ := io.ReadAll(resp.Body)
+			s.logger.Debugf("Response body: %s", body)
+		}
 		return fmt.Errorf("unexpected status code: %d", resp.StatusCode)
 	}
 